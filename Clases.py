@@ -1,74 +1,116 @@
 from __future__ import annotations
 
-from collections import defaultdict
-from collections.abc import Iterable
+import sys
+from collections.abc import Iterable, Set as AbstractSet
 from dataclasses import dataclass, field, is_dataclass, fields
 from datetime import date, datetime
 from enum import Enum
+from functools import cache, total_ordering
 from typing import ClassVar, Type, TypeVar, Any, get_type_hints, Generic, Callable, cast, Mapping, ValuesView
 
 
+class _MetaIdentificable(type):
+    """
+    Metaclase de Identificable. Al llamar al constructor con un ID ya registrado, retorna el objeto existente sin volver
+    a ejecutar __init__ sobre él, lo que sobrescribiría sus campos con los nuevos argumentos y reiniciaría los que
+    tienen valores por defecto (como las capacidades de un Trabajador).
+    """
+
+    def __call__(cls: type[Identificable], *args, **kwargs) -> Identificable:
+        id_ = cls._id_de_argumentos(args, kwargs)
+        existente = cls._registro.get(id_)
+        if existente is None:
+            # Se registra una vez construido, para no dejar en el registro objetos a medio construir.
+            obj = super(_MetaIdentificable, cls).__call__(*args, **kwargs)
+            cls._registro[id_] = obj
+            return obj
+        if cls._verify_duplicates:
+            cls._verificar_duplicado(existente, id_, args, kwargs)
+        return existente
+
+
 @dataclass(eq=False, slots=True, frozen=True)
-class Identificable:
+class Identificable(metaclass=_MetaIdentificable):
     """
     Clase que actúa como superclase para todas las clases que se quiera que hereden un atributo id: int que las
-    identifique de forma única. Posee también un atributo de clase _registros, un diccionario que mapea cada tipo de
-    clase (que se espera que sea solamente de las que extiendan Identificable) a un diccionario que mapea cada posible
-    id: int al objeto que tiene ese ID.
+    identifique de forma única. Cada clase que extienda Identificable posee además su propio atributo de clase
+    _registro, un diccionario que mapea cada posible id: int al objeto de esa clase que tiene ese ID.
     """
     id: int
-    _registros: ClassVar[dict[type, dict[int, Identificable]]] = defaultdict(dict)
+    _hash: int = field(init=False, repr=False, compare=False)
+    _registro: ClassVar[dict[int, Identificable]] = {}
+    # Comprueba que los campos coincidan al repetir un ID ya registrado.
+    _verify_duplicates: ClassVar[bool] = False
+    # Cierto mientras se construye el objeto dummy de esa comprobación.
+    _construyendo_dummy: ClassVar[bool] = False
+
+    def __init_subclass__(cls: type[Identificable], **kwargs) -> None:
+        """
+        Asigna a cada subclase su propio registro, de forma que acceder a él sea una simple consulta de atributo en
+        lugar de una búsqueda en un diccionario indexado por clase.
+        """
+        super(Identificable, cls).__init_subclass__(**kwargs)
+        cls._registro = {}
 
     @classmethod
     def get_registro[T: Identificable](cls: type[T]) -> dict[int, T]:
         """
-        Método de clase heredado por las clases que extiendan Identificable. Retorna el diccionario asignado a la propia
-        clase en el diccionario _registro de Identificable.
+        Método de clase heredado por las clases que extiendan Identificable. Retorna el diccionario _registro asignado
+        a la propia clase.
         """
-        return cls._registros[cls]
+        return cls._registro
 
-    def __new__(cls: type[Identificable], *args, **kwargs) -> Identificable:
+    @classmethod
+    def _id_de_argumentos(cls: type[Identificable], args: tuple, kwargs: dict[str, Any]) -> int:
         if 'id' in kwargs:
-            id_ = int(kwargs['id'])
+            return int(kwargs['id'])
         elif args:
-            id_ = int(args[0])
-        else:
-            raise ValueError(f"No se puede encontrar el argumento 'id' al crear un objeto de {cls.__name__} con parámetros {args} y {kwargs}")
+            return int(args[0])
+        raise ValueError(f"No se puede encontrar el argumento 'id' al crear un objeto de {cls.__name__} con parámetros {args} y {kwargs}")
 
-        registro = cls._registros[cls]
-        existente = registro.get(id_)
-
-        if existente is not None:
-            # Crea un objeto dummy para comparar atributos
-            dummy = super(Identificable, cls).__new__(cls)
-            object.__setattr__(dummy, 'id', id_)
+    @classmethod
+    def _verificar_duplicado(
+        cls: type[Identificable],
+        existente: Identificable,
+        id_: int,
+        args: tuple,
+        kwargs: dict[str, Any]
+    ) -> None:
+        """
+        Comprueba que los argumentos recibidos para un ID ya registrado coincidan con los campos del objeto existente,
+        lanzando un ValueError si no es así.
+        """
+        # Crea un objeto dummy para comparar atributos
+        dummy = super(Identificable, cls).__new__(cls)
+        object.__setattr__(dummy, 'id', id_)
+        cls._construyendo_dummy = True
+        try:
             dummy.__init__(*args, **kwargs)
-
-            for field_ in fields(cls):
-                if field_.name.startswith('_'):
-                    continue
-                valor_existente = getattr(existente, field_.name)
-                valor_nuevo = getattr(dummy, field_.name)
-                if valor_existente != valor_nuevo:
-                    raise ValueError(
-                        f"Conflicto con ID duplicado en id={id_} para la clase {cls.__name__}: "
-                        f"El campo '{field_.name}' es distinto "
-                        f"(existente={valor_existente!r}, nuevo={valor_nuevo!r})"
-                    )
-            return existente
-        else:
-            obj = super(Identificable, cls).__new__(cls)
-            registro[id_] = obj
-            return obj
+        finally:
+            cls._construyendo_dummy = False
+
+        for nombre_campo in _campos_publicos(cls):
+            valor_existente = getattr(existente, nombre_campo)
+            valor_nuevo = getattr(dummy, nombre_campo)
+            if valor_existente != valor_nuevo:
+                raise ValueError(
+                    f"Conflicto con ID duplicado en id={id_} para la clase {cls.__name__}: "
+                    f"El campo '{nombre_campo}' es distinto "
+                    f"(existente={valor_existente!r}, nuevo={valor_nuevo!r})"
+                )
 
     def __post_init__(self: Identificable) -> None:
         """
         Fuerza que el ID del objeto Identificable sea un entero, previendo los casos en los que se le pudiera
-        haber asignado un string.
+        haber asignado un string, y precalcula su hash.
         """
-        object.__setattr__(self, 'id', int(self.id))
+        if type(self.id) is not int:
+            object.__setattr__(self, 'id', int(self.id))
+        object.__setattr__(self, '_hash', hash((type(self), self.id)))
 
-    def __format__(self: Trabajador, format_spec: str) -> str:
+    def __format__(self: Identificable, format_spec: str) -> str:
+        if not format_spec:
+            return str(self)
         return format(str(self), format_spec)
 
     @classmethod
@@ -100,21 +142,38 @@ class Identificable:
         """
         return cls.from_id(data["id"]) or parse_data_into(cls, data)
 
+    @classmethod
+    def bulk_create[T: Identificable](cls: type[T], rows: Iterable[dict[str, Any]]) -> list[T]:
+        """
+        Equivalente a llamar a get_or_create sobre cada diccionario recibido.
+        :param rows: Iterable de diccionarios de los que obtener los datos de cada objeto.
+        :return: Lista con los objetos correspondientes a cada diccionario, en el mismo orden. Las filas cuyo ID ya
+        estaba registrado resuelven al objeto existente; el resto se construyen igual que en parse_data_into.
+        """
+        registro: dict[int, T] = cls._registro
+        tipos = _tipos_campos(cls)
+        resultado: list[T] = []
+        for data in rows:
+            existente = registro.get(int(data["id"]))
+            resultado.append(existente if existente is not None else _parse_con_tipos(cls, data, tipos))
+        return resultado
+
     def __int__(self: Identificable) -> int:
         return self.id
 
     def __eq__(self: Identificable, other: object) -> bool:
         """
-        Compara dos objetos, considerándolos iguales si el otro objeto es Identificable, es del mismo tipo que este, y
-        tiene el mismo ID.
+        Compara dos objetos, considerándolos iguales si el otro objeto es del mismo tipo que este y tiene el mismo ID.
+        Como el registro garantiza una única instancia por clase e ID, la comparación por identidad resuelve casi todos
+        los casos en los que los objetos son iguales.
         """
-        return isinstance(other, Identificable) and type(self) is type(other) and self.id == other.id
+        return self is other or (type(self) is type(other) and self.id == other.id)
 
     def __hash__(self: Identificable) -> int:
         """
-        Crea el hash del objeto teniendo en cuenta su tipo y su ID.
+        Retorna el hash del objeto, calculado en __post_init__ a partir de su tipo y su ID.
         """
-        return hash((type(self), self.id))
+        return self._hash
 
 
 @dataclass(eq=False, slots=True, frozen=True)
@@ -126,8 +185,14 @@ class Trabajador(Identificable):
     capacidades: dict[PuestoTrabajo, NivelDesempeno] = field(default_factory=dict)
 
     def __post_init__(self: Trabajador) -> None:
-        object.__setattr__(self, 'codigo', int(self.codigo))
-        super(Trabajador, self).__post_init__()
+        if type(self.codigo) is not int:
+            object.__setattr__(self, 'codigo', int(self.codigo))
+        # Se internan los nombres y apellidos, que se repiten entre trabajadores.
+        if type(self.nombre) is str:
+            object.__setattr__(self, 'nombre', sys.intern(self.nombre))
+        if type(self.apellidos) is str:
+            object.__setattr__(self, 'apellidos', sys.intern(self.apellidos))
+        Identificable.__post_init__(self)
 
     def actualizar_capacidades(self: Trabajador, puesto: PuestoTrabajo, nivel: NivelDesempeno) -> None:
         """
@@ -153,9 +218,6 @@ class Trabajador(Identificable):
 class PuestoTrabajo(Identificable):
     nombre_es: str
 
-    def __post_init__(self: PuestoTrabajo) -> None:
-        super(PuestoTrabajo, self).__post_init__()
-
     def __str__(self: PuestoTrabajo) -> str:
         return f'id={self.id} {self.nombre_es}'
 
@@ -167,9 +229,6 @@ class PuestoTrabajo(Identificable):
 class NivelDesempeno(Identificable):
     nombre_es: str
 
-    def __post_init__(self: NivelDesempeno) -> None:
-        super(NivelDesempeno, self).__post_init__()
-
     def __str__(self: NivelDesempeno) -> str:
         return f'{self.id}: {self.nombre_es}'
 
@@ -182,10 +241,18 @@ class TrabajadorPuestoTrabajo(Identificable):
     trabajador: Trabajador
     puesto_trabajo: PuestoTrabajo
     nivel_desempeno: NivelDesempeno
+    # Nombre completo del trabajador.
+    _nombre_y_apellidos: str | None = field(init=False, repr=False, compare=False)
 
     def __post_init__(self: TrabajadorPuestoTrabajo) -> None:
-        self.trabajador.actualizar_capacidades(self.puesto_trabajo, self.nivel_desempeno)
-        super(TrabajadorPuestoTrabajo, self).__post_init__()
+        nombre, apellidos = self.trabajador.nombre, self.trabajador.apellidos
+        if type(nombre) is str and type(apellidos) is str:
+            object.__setattr__(self, '_nombre_y_apellidos', sys.intern(nombre + " " + apellidos))
+        else:
+            object.__setattr__(self, '_nombre_y_apellidos', None)
+        if not type(self)._construyendo_dummy:
+            self.trabajador.actualizar_capacidades(self.puesto_trabajo, self.nivel_desempeno)
+        Identificable.__post_init__(self)
 
     @property
     def get_trabajador_id(self: TrabajadorPuestoTrabajo) -> int:
@@ -193,7 +260,9 @@ class TrabajadorPuestoTrabajo(Identificable):
 
     @property
     def get_trabajador_nombre_y_apellidos(self: TrabajadorPuestoTrabajo) -> str:
-        return self.trabajador.nombre + " " + self.trabajador.apellidos
+        if self._nombre_y_apellidos is None:
+            return self.trabajador.nombre + " " + self.trabajador.apellidos
+        return self._nombre_y_apellidos
 
     @property
     def get_puesto_trabajo_id(self: TrabajadorPuestoTrabajo) -> int:
@@ -292,10 +361,13 @@ class TipoJornada(Enum):
 
     id: int
     nombre_es: str
+    indice: int
 
     def __init__(self: TipoJornada, id: int, nombre_es: str) -> None:
         self.id = id
         self.nombre_es = nombre_es
+        # Posición en las tuplas indexadas por tipo de jornada.
+        self.indice = id - 1
 
     def __str__(self: TipoJornada) -> str:
         return self.nombre_es
@@ -303,16 +375,18 @@ class TipoJornada(Enum):
     @classmethod
     def from_id(cls: Type[TipoJornada], id_: int | str) -> TipoJornada | None:
         try:
-            id_ = int(id_)
-            for tipo_jornada in TipoJornada:
-                if tipo_jornada.id == id_:
-                    return tipo_jornada
+            return cls._por_id.get(int(id_))
         except (ValueError, TypeError) as e:
             print(id_, "cannot be converted to an integer")
             print(e)
             return None
 
 
+# Diccionario ID -> tipo de jornada, usado por from_id.
+TipoJornada._por_id = {tipo_jornada.id: tipo_jornada for tipo_jornada in TipoJornada}
+
+
+@total_ordering
 class Jornada(Enum):
     MANANA = (1, "Mañana", True, TipoJornada.MANANA)
     TARDE = (2, "Tarde", True, TipoJornada.TARDE)
@@ -334,50 +408,47 @@ class Jornada(Enum):
             return NotImplemented
         return self.id < other.id
 
-    def __le__(self: Jornada, other: Jornada) -> bool:
-        if not isinstance(other, Jornada):
-            return NotImplemented
-        return self.id <= other.id
-
-    def __gt__(self: Jornada, other: Jornada) -> bool:
-        if not isinstance(other, Jornada):
-            return NotImplemented
-        return self.id > other.id
-
-    def __ge__(self: Jornada, other: Jornada) -> bool:
-        if not isinstance(other, Jornada):
-            return NotImplemented
-        return self.id >= other.id
-
     @classmethod
-    def jornadas_nocturnas(cls: Jornada) -> set[Jornada]:
-        return {
-            jornada
-            for jornada in Jornada
-            if jornada.tipo_jornada == TipoJornada.NOCHE
-        }
+    def jornadas_nocturnas(cls: Jornada) -> frozenset[Jornada]:
+        return cls._nocturnas
 
     @classmethod
-    def jornadas_puede_doblar(cls: Jornada) -> set[Jornada]:
-        return {jornada for jornada in Jornada if jornada.puede_doblar}
+    def jornadas_puede_doblar(cls: Jornada) -> frozenset[Jornada]:
+        return cls._puede_doblar
 
     @classmethod
-    def jornadas_con_preferencia(cls: Jornada) -> set[Jornada]:
-        return {Jornada.MANANA, Jornada.TARDE, Jornada.NOCHE1, Jornada.NOCHE2}
+    def jornadas_con_preferencia(cls: Jornada) -> frozenset[Jornada]:
+        return cls._con_preferencia
 
     @classmethod
     def from_id(cls: Type[Jornada], id_: int | str) -> Jornada | None:
         try:
-            id_ = int(id_)
-            for jornada in Jornada:
-                if jornada.id == id_:
-                    return jornada
+            return cls._por_id.get(int(id_))
         except (ValueError, TypeError) as e:
             print(id_, "cannot be converted to an integer")
             print(e)
             return None
 
 
+# Conjuntos de jornadas con cada propiedad.
+Jornada._nocturnas = frozenset(
+    jornada
+    for jornada in Jornada
+    if jornada.tipo_jornada is TipoJornada.NOCHE
+)
+Jornada._puede_doblar = frozenset(jornada for jornada in Jornada if jornada.puede_doblar)
+Jornada._con_preferencia = frozenset({Jornada.MANANA, Jornada.TARDE, Jornada.NOCHE1, Jornada.NOCHE2})
+Jornada._por_id = {jornada.id: jornada for jornada in Jornada}
+
+
+@cache
+def _campos_publicos(cls: type) -> tuple[str, ...]:
+    """
+    Retorna los nombres de los campos de una dataclass que no empiezan por guion bajo.
+    """
+    return tuple(field_.name for field_ in fields(cls) if not field_.name.startswith('_'))
+
+
 def parse_data_into[T](cls: type[T], data: dict[str, Any]) -> T:
     """
     Parsea el contenido de un diccionario en una clase, asignándole a sus atributos los valores de las llaves del
@@ -389,6 +460,10 @@ def parse_data_into[T](cls: type[T], data: dict[str, Any]) -> T:
     Las llaves cuyo nombre coincida con una anotación de tipo de los atributos de la clase serán recursivamente parseados
     en ese atributo.
 
+    Los atributos cuyo tipo extienda Identificable se resuelven a la instancia registrada: si el valor es un ID se busca
+    en el registro, y si es un diccionario se usa get_or_create. Los valores nulos y los IDs no registrados se asignan
+    sin cambios.
+
     :param cls: Clase de la que crear el objeto.
     :param data: Diccionario conteniendo los valores de los atributos.
     :return: Un objeto de la clase cls cuyos atributos toman como valor los valores de las llaves del diccionario que
@@ -399,24 +474,73 @@ def parse_data_into[T](cls: type[T], data: dict[str, Any]) -> T:
     if not is_dataclass(cls):
         raise ValueError(f"{cls.__name__} is not a dataclass")
 
-    type_hints: dict[str, Any] = get_type_hints(cls)
-    field_names_and_types: dict[str, Any] = {
-        field.name : type_hints[field.name]
-        for field in fields(cls)
-    }
+    return _parse_con_tipos(cls, data, _tipos_campos(cls))
+
+
+def _parse_con_tipos[T](
+    cls: type[T],
+    data: dict[str, Any],
+    tipos: tuple[dict[str, Any], dict[str, tuple[str, type]], dict[str, type[Identificable]]]
+) -> T:
+    field_names_and_types, campos_anidados, campos_identificables = tipos
     filtered_data: dict[str, Any] = {}
     for k, v in data.items():
         if k in field_names_and_types:
+            tipo_identificable: type[Identificable] | None = campos_identificables.get(k)
+            if tipo_identificable is not None and not isinstance(v, Identificable):
+                v = _resolver_identificable(tipo_identificable, v)
             filtered_data[k] = v
         else:
-            for field_name, field_type in field_names_and_types.items():
-                if is_dataclass(field_type) and field_type.__name__ == k:
+            campo_anidado: tuple[str, type] | None = campos_anidados.get(k)
+            if campo_anidado is not None:
+                field_name, field_type = campo_anidado
+                if field_name in campos_identificables:
+                    filtered_data[field_name] = _resolver_identificable(field_type, v)
+                else:
                     filtered_data[field_name] = parse_data_into(field_type, v)
-                    break
 
     return cls(**filtered_data)
 
 
+def _resolver_identificable[T: Identificable](cls: type[T], valor: Any) -> T | Any:
+    # Los valores nulos y los IDs no registrados se dejan tal cual.
+    if valor is None:
+        return None
+    if isinstance(valor, Mapping):
+        return cls.get_or_create(valor)
+    try:
+        existente: T | None = cls._registro.get(int(valor))
+    except (ValueError, TypeError):
+        return valor
+    return valor if existente is None else existente
+
+
+@cache
+def _tipos_campos(cls: type) -> tuple[dict[str, Any], dict[str, tuple[str, type]], dict[str, type[Identificable]]]:
+    """
+    Retorna, para cada clase, la información de sus campos que necesita parse_data_into.
+    :param cls: Dataclass de la que obtener la información de sus campos.
+    :return: Un diccionario que mapea el nombre de cada campo a su tipo, y otro que mapea el nombre de cada tipo de
+    campo que sea una dataclass al nombre del primer campo con ese tipo y al propio tipo. Además, un tercer diccionario
+    con los campos cuyo tipo extiende Identificable.
+    """
+    type_hints: dict[str, Any] = get_type_hints(cls)
+    field_names_and_types: dict[str, Any] = {
+        field.name : type_hints[field.name]
+        for field in fields(cls)
+    }
+    campos_anidados: dict[str, tuple[str, type]] = {}
+    for field_name, field_type in field_names_and_types.items():
+        if is_dataclass(field_type):
+            campos_anidados.setdefault(field_type.__name__, (field_name, field_type))
+    campos_identificables: dict[str, type[Identificable]] = {
+        field_name : field_type
+        for field_name, field_type in field_names_and_types.items()
+        if isinstance(field_type, type) and issubclass(field_type, Identificable)
+    }
+    return field_names_and_types, campos_anidados, campos_identificables
+
+
 def get_by_id[T](
     collection: Iterable[T],
     cls: type[T],
@@ -431,24 +555,38 @@ def get_by_id[T](
     :param fallback: Valor por defecto que retornar si no se encuentra el ID. Por defecto es None.
     :return: El único objeto del iterable con el ID recibido como argumento, o fallback si no se encuentra.
 
-    Para maximizar la eficiencia del algoritmo, primero busca con orden O(1) el objeto en el _registro global, y
-    comprueba si el resultado obtenido está en la colección. Si es así, lo retorna. En otro caso, busca manualmente en la
-    colección por un item con el ID recibido como argumento, y si lo encuentra, lo añade al registro y lo retorna.
-    Si no lo encuentra, retorna fallback.
+    Si la colección es un conjunto o un diccionario (cuyas llaves son los objetos), primero busca con orden O(1) el
+    objeto en el _registro global, y comprueba con otra consulta O(1) si está en la colección. Como dos objetos de la
+    misma clase con el mismo ID son iguales, si el ID está registrado no hace falta recorrerla.
+
+    En otro caso, recorre la colección buscando un item con el ID recibido como argumento, y si lo
+    encuentra, lo añade al registro y lo retorna. Si no lo encuentra, o el ID no se puede convertir a un entero, retorna
+    fallback.
     """
-    candidate: T = cls.from_id(id_)
-    if candidate in collection:
-        return candidate
-    else:
-        for item in collection: # type: T
-            if item.id == id_:
-                cls.get_registro()[item.id] = item
-                return item
+    try:
+        id_ = int(id_)
+    except (ValueError, TypeError):
         return fallback
-
-
-def parse_bool(value: str | int) -> bool:
-    return str(value).strip() in {'true', 'True', '1', 'yes', 'Yes', 'y', 'Y'}
+    if isinstance(collection, (AbstractSet, Mapping)):
+        candidate: T | None = cls.from_id(id_)
+        if candidate is not None:
+            return candidate if candidate in collection else fallback
+    for item in collection: # type: T
+        if item.id == id_:
+            cls.get_registro()[item.id] = item
+            return item
+    return fallback
+
+
+_VALORES_VERDADEROS: frozenset[str] = frozenset({'true', 'True', '1', 'yes', 'Yes', 'y', 'Y'})
+
+
+def parse_bool(value: str | int | bool) -> bool:
+    if value is True or value is False:
+        return value
+    if type(value) is int:
+        return value == 1
+    return str(value).strip() in _VALORES_VERDADEROS
 
 
 if __name__ == "__main__":
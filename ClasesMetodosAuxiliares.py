@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from enum import IntFlag
+from functools import cached_property
 from typing import NamedTuple
-from immutabledict import immutabledict
 from ortools.sat.python.cp_model import IntVar, CpSolver
 
 from Clases import TipoJornada, Jornada, PuestoTrabajo, Trabajador
@@ -16,11 +17,16 @@ class Asignacion(NamedTuple):
     puntuacion: int
 
 
-class Verbose(NamedTuple):
-    estadisticas_avanzadas: bool
-    general: bool
-    asignacion_trabajadores: bool
-    asignacion_puestos: bool
+class Verbose(IntFlag):
+    """
+    Máscara de bits que controla qué información se imprime por pantalla al resolver una asignación. Las opciones se
+    combinan con el operador |, y se comprueban con el operador &.
+    """
+    NINGUNO = 0
+    ESTADISTICAS_AVANZADAS = 1
+    GENERAL = 2
+    ASIGNACION_TRABAJADORES = 4
+    ASIGNACION_PUESTOS = 8
 
 
 class DatosTrabajadoresPuestosJornadas(NamedTuple):
@@ -35,31 +41,43 @@ class ListasPreferencias(NamedTuple):
     voluntarios_doble: list[Trabajador]
 
 
-class IndicesPreferencias(NamedTuple):
-    especialidades: dict[tuple[PuestoTrabajo, Trabajador], int]
-    preferencias_jornada: dict[tuple[TipoJornada, Trabajador], int]
-    voluntarios_doble: dict[Trabajador, int]
-
-    @classmethod
-    def from_listas(cls: IndicesPreferencias, listas: ListasPreferencias) -> IndicesPreferencias:
-        especialidades: dict[tuple[PuestoTrabajo, Trabajador], int] = {
-            (puesto, trabajador) : listas.especialidades[puesto].index(trabajador)
-            for puesto in listas.especialidades
-            for trabajador in listas.especialidades[puesto]
-        }
-
-        preferencias_jornada: dict[tuple[TipoJornada, Trabajador], int] = {
-            (tipo_jornada, trabajador) : listas.preferencias_jornada[tipo_jornada].index(trabajador)
-            for tipo_jornada in listas.preferencias_jornada
-            for trabajador in listas.preferencias_jornada[tipo_jornada]
-        }
+class IndicesPreferencias:
+    """
+    Posiciones de cada trabajador en las listas de preferencias. Cada diccionario se construye la primera vez que se
+    accede a él, de forma que solo se paga el coste de los índices que realmente se consultan.
+    """
 
-        voluntarios_doble: dict[Trabajador, int] = {
-            trabajador : listas.voluntarios_doble.index(trabajador)
-            for trabajador in listas.voluntarios_doble
-        }
+    def __init__(self: IndicesPreferencias, listas: ListasPreferencias) -> None:
+        self.listas = listas
 
-        return IndicesPreferencias(especialidades, preferencias_jornada, voluntarios_doble)
+    @classmethod
+    def from_listas(cls: type[IndicesPreferencias], listas: ListasPreferencias) -> IndicesPreferencias:
+        return cls(listas)
+
+    # Como en list.index, se conserva la primera posición de cada trabajador repetido.
+
+    @cached_property
+    def especialidades(self: IndicesPreferencias) -> dict[tuple[PuestoTrabajo, Trabajador], int]:
+        indices: dict[tuple[PuestoTrabajo, Trabajador], int] = {}
+        for puesto, lista_trabajadores in self.listas.especialidades.items():
+            for indice, trabajador in enumerate(lista_trabajadores):
+                indices.setdefault((puesto, trabajador), indice)
+        return indices
+
+    @cached_property
+    def preferencias_jornada(self: IndicesPreferencias) -> dict[tuple[TipoJornada, Trabajador], int]:
+        indices: dict[tuple[TipoJornada, Trabajador], int] = {}
+        for tipo_jornada, lista_trabajadores in self.listas.preferencias_jornada.items():
+            for indice, trabajador in enumerate(lista_trabajadores):
+                indices.setdefault((tipo_jornada, trabajador), indice)
+        return indices
+
+    @cached_property
+    def voluntarios_doble(self: IndicesPreferencias) -> dict[Trabajador, int]:
+        indices: dict[Trabajador, int] = {}
+        for indice, trabajador in enumerate(self.listas.voluntarios_doble):
+            indices.setdefault(trabajador, indice)
+        return indices
 
 
 @dataclass(frozen=True, slots=True)
@@ -82,37 +100,34 @@ class ParametrosPuntuacion:
     max_voluntarios_doble: int = -1000 # Este parámetro tiene un valor negativo para desincentivar que se asignen dobles
     decay_voluntarios_doble: int = 1
 
-    max_preferencia_por_jornada: immutabledict[TipoJornada, int] = immutabledict({
-        TipoJornada.MANANA : 300,
-        TipoJornada.TARDE : 500,
-        TipoJornada.NOCHE : 700,
-    })
+    # Tuplas indexadas por TipoJornada.indice: (mañana, tarde, noche).
+    max_preferencia_por_jornada: tuple[int, int, int] = (300, 500, 700)
 
-    decay_preferencia_por_jornada: immutabledict[TipoJornada, int] = immutabledict({
-        TipoJornada.MANANA: 1,
-        TipoJornada.TARDE: 1,
-        TipoJornada.NOCHE: 1,
-    })
+    decay_preferencia_por_jornada: tuple[int, int, int] = (1, 1, 1)
 
-    penalizacion_por_jornada: immutabledict[TipoJornada, int] = immutabledict({
-        TipoJornada.MANANA: 0,
-        TipoJornada.TARDE: 50,
-        TipoJornada.NOCHE: 500,
-    })
+    penalizacion_por_jornada: tuple[int, int, int] = (0, 50, 500)
 
-    def unpack(self: ParametrosPuntuacion) -> tuple:
-        return (
+    # Tuplas desempaquetadas.
+    _unpacked: tuple = field(init=False, repr=False, compare=False)
+    _unpacked_festivo: tuple = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self: ParametrosPuntuacion) -> None:
+        object.__setattr__(self, '_unpacked', (
             self.max_especialidad, self.decay_especialidad,
             self.max_capacidad, self.decay_capacidad,
             self.max_voluntarios_doble, self.decay_voluntarios_doble,
             self.max_preferencia_por_jornada, self.decay_preferencia_por_jornada, self.penalizacion_por_jornada
-        )
-
-    def unpack_festivo(self: ParametrosPuntuacion) -> tuple:
-        return (
+        ))
+        object.__setattr__(self, '_unpacked_festivo', (
             self.max_capacidad, self.decay_capacidad,
             self.max_voluntarios_doble, self.decay_voluntarios_doble
-        )
+        ))
+
+    def unpack(self: ParametrosPuntuacion) -> tuple:
+        return self._unpacked
+
+    def unpack_festivo(self: ParametrosPuntuacion) -> tuple:
+        return self._unpacked_festivo
 
 
 def print_estadisticas_avanzadas(solver: CpSolver, mensaje: str = ""):
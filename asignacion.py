@@ -7,7 +7,7 @@ from ortools.sat.python import cp_model
 from ortools.sat.python.cp_model import CpModel, IntVar, LinearExpr, CpSolver
 
 from ClasesMetodosAuxiliares import ListasPreferencias, ParametrosPuntuacion, Verbose, DatosTrabajadoresPuestosJornadas, \
-    Asignacion, print_estadisticas_avanzadas, formatear_float
+    Asignacion, IndicesPreferencias, print_estadisticas_avanzadas, formatear_float
 from Clases import Trabajador, PuestoTrabajo, Jornada, TipoJornada, NivelDesempeno
 from parse import data
 
@@ -82,7 +82,11 @@ def calcular_coeficientes_puntuacion(
     coeficientes_asignaciones: dict[tuple[Trabajador, PuestoTrabajo, Jornada], int] = {}
     coeficientes_dobles: dict[Trabajador, int] = {}
 
-    especialidades, preferencia_por_jornada, voluntarios_doble = listas_preferencias
+    # Posiciones de cada trabajador en las listas de preferencias.
+    indices: IndicesPreferencias = IndicesPreferencias.from_listas(listas_preferencias)
+    indices_especialidades: dict[tuple[PuestoTrabajo, Trabajador], int] = indices.especialidades
+    indices_preferencias_jornada: dict[tuple[TipoJornada, Trabajador], int] = indices.preferencias_jornada
+    indices_voluntarios_doble: dict[Trabajador, int] = indices.voluntarios_doble
 
     (
         max_especialidad, decay_especialidad,
@@ -91,32 +95,40 @@ def calcular_coeficientes_puntuacion(
         max_preferencia_por_jornada, decay_preferencia_por_jornada, penalizacion_por_jornada
     ) = parametros.unpack()
 
-    for trabajador in voluntarios_doble:
-        coeficientes_dobles[trabajador] = max_voluntarios_doble - decay_voluntarios_doble * voluntarios_doble.index(trabajador)
-
-    for trabajador in trabajadores:
-        for puesto in trabajador.capacidades:
-            for jornada in jornadas:
-                if (trabajador, jornada) in disponibilidad:
-                    # Puntuación por capacidad.
-                    puntuacion_capacidad: int = max(0, max_capacidad - decay_capacidad * (trabajador.capacidades[puesto].id - 1))
-
-                    # Puntuación por estar más alto en las listas de especialidades.
-                    puntuacion_especialidad: int = 0
-                    especialistas_puesto: list[Trabajador] = especialidades.get(puesto, [])
-                    if trabajador in especialistas_puesto:
-                        puntuacion_especialidad = max(0, max_especialidad - decay_especialidad * especialistas_puesto.index(trabajador))
+    for trabajador, indice in indices_voluntarios_doble.items():
+        coeficientes_dobles[trabajador] = max_voluntarios_doble - decay_voluntarios_doble * indice
 
-                    # Puntuación por preferencia de jornada o penalización por no ser voluntario para noche
-                    puntuacion_jornada: int = 0
-                    if jornada in Jornada.jornadas_con_preferencia():
-                        tipo_jornada = jornada.tipo_jornada
-                        if trabajador in preferencia_por_jornada[tipo_jornada]:
-                            puntuacion_jornada += max_preferencia_por_jornada[tipo_jornada] - decay_preferencia_por_jornada[tipo_jornada] * preferencia_por_jornada[tipo_jornada].index(trabajador)
-                        else:
-                            puntuacion_jornada -= penalizacion_por_jornada[tipo_jornada]
+    jornadas_con_preferencia: frozenset[Jornada] = Jornada.jornadas_con_preferencia()
 
-                    coeficientes_asignaciones[trabajador, puesto, jornada] = puntuacion_capacidad + puntuacion_especialidad + puntuacion_jornada
+    for trabajador in trabajadores:
+        # Puntuación por jornada, que no depende del puesto.
+        puntuaciones_jornada: dict[Jornada, int] = {}
+        for jornada in jornadas:
+            if (trabajador, jornada) in disponibilidad:
+                # Puntuación por preferencia de jornada o penalización por no ser voluntario para noche
+                puntuacion_jornada: int = 0
+                if jornada in jornadas_con_preferencia:
+                    tipo_jornada = jornada.tipo_jornada
+                    indice_jornada: int | None = indices_preferencias_jornada.get((tipo_jornada, trabajador))
+                    if indice_jornada is not None:
+                        puntuacion_jornada += max_preferencia_por_jornada[tipo_jornada.indice] - decay_preferencia_por_jornada[tipo_jornada.indice] * indice_jornada
+                    else:
+                        puntuacion_jornada -= penalizacion_por_jornada[tipo_jornada.indice]
+                puntuaciones_jornada[jornada] = puntuacion_jornada
+
+        for puesto, nivel in trabajador.capacidades.items():
+            # Puntuación por capacidad.
+            puntuacion_capacidad: int = max(0, max_capacidad - decay_capacidad * (nivel.id - 1))
+
+            # Puntuación por estar más alto en las listas de especialidades.
+            puntuacion_especialidad: int = 0
+            indice_especialidad: int | None = indices_especialidades.get((puesto, trabajador))
+            if indice_especialidad is not None:
+                puntuacion_especialidad = max(0, max_especialidad - decay_especialidad * indice_especialidad)
+
+            puntuacion_puesto: int = puntuacion_capacidad + puntuacion_especialidad
+            for jornada, puntuacion_jornada in puntuaciones_jornada.items():
+                coeficientes_asignaciones[trabajador, puesto, jornada] = puntuacion_puesto + puntuacion_jornada
 
     return coeficientes_asignaciones, coeficientes_dobles
 
@@ -131,7 +143,7 @@ def realizar_asignacion(
     # Tuplas (trabajador, jornada) en las que el trabajador está disponible en esa jornada.
     disponibilidad: set[tuple[Trabajador, Jornada]],
     # Parámetros para controlar si se imprime por pantalla la solución encontrada y estadísticas sobre la resolución.
-    verbose: Verbose = Verbose(False, False, False, False),
+    verbose: Verbose = Verbose.NINGUNO,
     # Parámetros para el cálculo de la función objetivo a maximizar
     parametros: ParametrosPuntuacion = ParametrosPuntuacion()
 ) -> set[tuple[Trabajador, PuestoTrabajo, Jornada]]:
@@ -205,7 +217,7 @@ def realizar_asignacion(
             asignacion.var
             for asignacion in asignaciones
             if asignacion.jornada in Jornada.jornadas_con_preferencia()
-            and asignacion.jornada.tipo_jornada == tipo_jornada
+            and asignacion.jornada.tipo_jornada is tipo_jornada
             and asignacion.trabajador in set_preferencias_por_jornada[tipo_jornada]
         ])
         for tipo_jornada in TipoJornada
@@ -310,7 +322,7 @@ def realizar_asignacion(
     # *********************************** CÁLCULO Y VISUALIZACIÓN DEL RESULTADO ****************************************
     # ******************************************************************************************************************
 
-    if verbose.general:
+    if verbose & Verbose.GENERAL:
         if status == cp_model.OPTIMAL:
             print("Se encontró una solución óptima.")
         elif status == cp_model.FEASIBLE:
@@ -318,7 +330,7 @@ def realizar_asignacion(
         else:
             print(f"No se encontraron soluciones.")
 
-    if verbose.estadisticas_avanzadas:
+    if verbose & Verbose.ESTADISTICAS_AVANZADAS:
         print_estadisticas_avanzadas(solver, "Estadísticas avanzadas")
 
     resultado: set[tuple[Trabajador, PuestoTrabajo, Jornada]] = {
@@ -358,7 +370,7 @@ def realizar_asignacion(
     }, default=None)
 
 
-    if verbose.general:
+    if verbose & Verbose.GENERAL:
 
         num_trabajadores_asignados: int = len({trabajador for trabajador, _, _ in resultado})
         num_trabajadores_disponibles: int = len({asignacion.trabajador for asignacion in asignaciones})
@@ -430,7 +442,7 @@ def realizar_asignacion(
         print(f'Puntuación alcanzada: {int(solver.ObjectiveValue())}\n')
 
 
-    if verbose.asignacion_trabajadores:
+    if verbose & Verbose.ASIGNACION_TRABAJADORES:
         for trabajador, puesto, jornada in resultado:
             realiza_doble: str = 'DOBLE' if trabajador in trabajadores_asignados_dobles else ''
             polivalencia: str = trabajador.capacidades[puesto].nombre_es + (" ("+str(especialidades.get(puesto, []).index(trabajador))+")" if puesto in trabajador.especialidades and puesto in especialidades else "")
@@ -451,8 +463,8 @@ def realizar_asignacion(
             )
 
 
-    if verbose.asignacion_puestos:
-        if verbose.asignacion_trabajadores:
+    if verbose & Verbose.ASIGNACION_PUESTOS:
+        if verbose & Verbose.ASIGNACION_TRABAJADORES:
             print("\n\n")
 
         for puesto in puestos:
@@ -520,12 +532,7 @@ def test_tiempo_ejecucion(n: int, datos) -> None:
     for i in range(n):
         _, solver = realizar_asignacion(
             *datos,
-            verbose=Verbose(
-                general=False,
-                estadisticas_avanzadas=False,
-                asignacion_puestos=False,
-                asignacion_trabajadores=False
-            )
+            verbose=Verbose.NINGUNO
         )
         tiempo = solver.wall_time
         tiempo_total += tiempo
@@ -540,10 +547,5 @@ if __name__ == "__main__":
     datos = data
     resultado = realizar_asignacion(
         *datos,
-        verbose=Verbose(
-            general=True,
-            estadisticas_avanzadas=True,
-            asignacion_puestos=False,
-            asignacion_trabajadores=True
-        )
+        verbose=Verbose.GENERAL | Verbose.ESTADISTICAS_AVANZADAS | Verbose.ASIGNACION_TRABAJADORES
     )
\ No newline at end of file
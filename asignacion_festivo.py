@@ -36,8 +36,10 @@ def calcular_coeficientes_puntuacion_festivo(
         max_voluntarios_doble, decay_voluntarios_doble,
     ) = parametros.unpack_festivo()
 
-    for trabajador in voluntarios_doble:
-        coeficientes_dobles[trabajador] = max_voluntarios_doble - decay_voluntarios_doble * voluntarios_doble.index(trabajador)
+    for indice, trabajador in enumerate(voluntarios_doble):
+        # Como en list.index, cuenta la primera posición del trabajador.
+        if trabajador not in coeficientes_dobles:
+            coeficientes_dobles[trabajador] = max_voluntarios_doble - decay_voluntarios_doble * indice
 
     for trabajador in trabajadores:
         for puesto in trabajador.capacidades:
@@ -60,7 +62,7 @@ def realizar_asignacion_festivo(
     # Tuplas (trabajador, jornada) en las que el trabajador está disponible en esa jornada.
     disponibilidad: set[tuple[Trabajador, Jornada]],
     # Parámetros para controlar si se imprime por pantalla la solución encontrada y estadísticas sobre la resolución.
-    verbose: Verbose = Verbose(False, False, False, False),
+    verbose: Verbose = Verbose.NINGUNO,
     # Parámetros para el cálculo de la función objetivo a maximizar
     parametros: ParametrosPuntuacion = ParametrosPuntuacion()
 ) -> set[tuple[Trabajador, PuestoTrabajo, Jornada]]:
@@ -134,7 +136,7 @@ def realizar_asignacion_festivo(
             asignacion.var
             for asignacion in asignaciones
             if asignacion.jornada in Jornada.jornadas_con_preferencia()
-            and asignacion.jornada.tipo_jornada == tipo_jornada
+            and asignacion.jornada.tipo_jornada is tipo_jornada
             and asignacion.trabajador in set_preferencias_por_jornada[tipo_jornada]
         ])
         for tipo_jornada in TipoJornada
@@ -239,7 +241,7 @@ def realizar_asignacion_festivo(
     # *********************************** CÁLCULO Y VISUALIZACIÓN DEL RESULTADO ****************************************
     # ******************************************************************************************************************
 
-    if verbose.general:
+    if verbose & Verbose.GENERAL:
         if status == cp_model.OPTIMAL:
             print("Se encontró una solución óptima.")
         elif status == cp_model.FEASIBLE:
@@ -247,7 +249,7 @@ def realizar_asignacion_festivo(
         else:
             print(f"No se encontraron soluciones.")
 
-    if verbose.estadisticas_avanzadas:
+    if verbose & Verbose.ESTADISTICAS_AVANZADAS:
         print_estadisticas_avanzadas(solver, "Estadísticas avanzadas")
 
     resultado: set[tuple[Trabajador, PuestoTrabajo, Jornada]] = {
@@ -287,7 +289,7 @@ def realizar_asignacion_festivo(
     }, default=None)
 
 
-    if verbose.general:
+    if verbose & Verbose.GENERAL:
 
         num_trabajadores_asignados: int = len({trabajador for trabajador, _, _ in resultado})
         num_trabajadores_disponibles: int = len({asignacion.trabajador for asignacion in asignaciones})
@@ -359,7 +361,7 @@ def realizar_asignacion_festivo(
         print(f'Puntuación alcanzada: {int(solver.ObjectiveValue())}\n')
 
 
-    if verbose.asignacion_trabajadores:
+    if verbose & Verbose.ASIGNACION_TRABAJADORES:
         for trabajador, puesto, jornada in resultado:
             realiza_doble: str = 'DOBLE' if trabajador in trabajadores_asignados_dobles else ''
             polivalencia: str = trabajador.capacidades[puesto].nombre_es + (" ("+str(especialidades.get(puesto, []).index(trabajador))+")" if puesto in trabajador.especialidades and puesto in especialidades else "")
@@ -380,8 +382,8 @@ def realizar_asignacion_festivo(
             )
 
 
-    if verbose.asignacion_puestos:
-        if verbose.asignacion_trabajadores:
+    if verbose & Verbose.ASIGNACION_PUESTOS:
+        if verbose & Verbose.ASIGNACION_TRABAJADORES:
             print("\n\n")
 
         for puesto in puestos:
@@ -449,12 +451,7 @@ def test_tiempo_ejecucion(n: int, datos) -> None:
     for i in range(n):
         _, solver = realizar_asignacion_festivo(
             *datos,
-            verbose=Verbose(
-                general=False,
-                estadisticas_avanzadas=False,
-                asignacion_puestos=False,
-                asignacion_trabajadores=False
-            )
+            verbose=Verbose.NINGUNO
         )
         tiempo = solver.wall_time
         tiempo_total += tiempo
@@ -469,10 +466,5 @@ if __name__ == "__main__":
     datos = data
     resultado = realizar_asignacion_festivo(
         *datos,
-        verbose=Verbose(
-            general=True,
-            estadisticas_avanzadas=True,
-            asignacion_puestos=False,
-            asignacion_trabajadores=True
-        )
+        verbose=Verbose.GENERAL | Verbose.ESTADISTICAS_AVANZADAS | Verbose.ASIGNACION_TRABAJADORES
     )
\ No newline at end of file
@@ -29,11 +29,11 @@ def compute_loss(
     for trabajador, puesto, jornada in asignacion:
         if puesto not in trabajador.especialidades:
             especialidad_no_asignada+=1
-        if trabajador not in voluntarios_noche and jornada.tipo_jornada == TipoJornada.NOCHE:
+        if trabajador not in voluntarios_noche and jornada.tipo_jornada is TipoJornada.NOCHE:
             no_voluntario_noche_asignados+=1
-        if trabajador in preferencia_manana and jornada.tipo_jornada != TipoJornada.MANANA:
+        if trabajador in preferencia_manana and jornada.tipo_jornada is not TipoJornada.MANANA:
             preferencia_manana_tarde_no_respetadas+=1
-        if trabajador in preferencia_tarde and jornada.tipo_jornada != TipoJornada.TARDE:
+        if trabajador in preferencia_tarde and jornada.tipo_jornada is not TipoJornada.TARDE:
             preferencia_manana_tarde_no_respetadas+=1
 
     return {
@@ -75,7 +75,7 @@ def objective(trial) -> int:
         listas_preferencias,
         demanda,
         disponibilidad,
-        verbose=Verbose(False, False, False, False),
+        verbose=Verbose.NINGUNO,
         parametros=ParametrosPuntuacion(
             coef_especialidad=coef_especialidad,
             max_especialidad=max_especialidad,